@@ -1,2 +1,246 @@
-from src.redblacktree import RedblackTree
+import importlib.util
+import random
+import unittest
 
+import src.redblacktree
+from src.redblacktree import RBColorEnum, RedBlackTree
+
+
+class RedBlackTreeTest(unittest.TestCase):
+    """
+    Regression tests, run from the repo root:
+        python -m unittest _test
+    """
+
+    def assert_tree(self, tree, expected, reverse=False):
+        """
+        Checks the tree is valid and holds expected's keys/values.
+        reverse is for trees that order keys largest first.
+        """
+
+        if tree._root is not None:
+            self.assertTrue(tree.is_set_correctly(tree._root)[0])
+        rows = tree.in_order(tree._root)
+        self.assertEqual(
+            [(key, values) for key, values, _, _ in rows],
+            sorted(expected.items(), reverse=reverse)
+        )
+
+    def test_random_add_remove(self):
+        rng = random.Random(1234)
+        for _ in range(20):
+            tree = RedBlackTree()
+            expected = {}
+
+            # Adds, duplicates included.
+            for key in rng.choices(range(300), k=300):
+                tree.add(key, key * 10)
+                expected.setdefault(key, []).append(key * 10)
+            self.assert_tree(tree, expected)
+
+            # Removes, through every delete case.
+            for key in rng.sample(range(300), 300):
+                tree.remove_key(key)
+                expected.pop(key, None)
+                self.assert_tree(tree, expected)
+
+            self.assertIsNone(tree._root)
+
+    def test_is_set_correctly(self):
+        tree = RedBlackTree.from_sorted([(key, key) for key in range(15)])
+        self.assertEqual(tree.is_set_correctly(tree._root), (True, 4))
+
+        # A RED root isn't allowed.
+        tree._root._color = RBColorEnum.RED
+        self.assertEqual(tree.is_set_correctly(tree._root), (False, 0))
+
+    def test_empty_tree(self):
+        tree = RedBlackTree()
+        self.assertFalse(tree.contains(1))
+        self.assertFalse(1 in tree)
+        self.assertEqual(tree.find_node(1), (None, None))
+        tree.remove_key(1)
+        tree.remove_value(1, 1)
+        self.assertIsNone(tree._root)
+
+    def test_from_sorted(self):
+        items = [(1, "a"), (1, "b"), (5, "c"), (9, "d")]
+        tree = RedBlackTree.from_sorted(items)
+        self.assert_tree(tree, {1: ["a", "b"], 5: ["c"], 9: ["d"]})
+        self.assertTrue(5 in tree)
+
+        # Out of order keys are refused.
+        with self.assertRaises(Exception):
+            RedBlackTree.from_sorted([(5, "a"), (1, "b"), (9, "c")])
+
+    def test_update_keeps_nodes(self):
+        tree = RedBlackTree()
+        tree.add(1, "a")
+        node = tree[1]
+        tree.update([(2, "b"), (3, "c"), (1, "d")])
+        self.assertIs(tree[1], node)
+        self.assert_tree(tree, {1: ["a", "d"], 2: ["b"], 3: ["c"]})
+
+    def test_removed_values_untouched(self):
+        tree = RedBlackTree()
+        for key in range(10):
+            tree.add(key, key)
+        values = tree[3]._values
+        tree.remove_key(3)
+        other = RedBlackTree()
+        other.add(100, "other")
+        self.assertEqual(values, [3])
+        self.assertIsNot(values, other[100]._values)
+
+    def test_custom_comparator(self):
+        rng = random.Random(99)
+
+        # Largest keys first, so none of the default comparisons apply.
+        tree = RedBlackTree(
+            key_comparator_function=lambda one, two: one > two,
+            key_equals_function=lambda one, two: one == two
+        )
+        expected = {}
+        for key in rng.choices(range(200), k=200):
+            tree.add(key, key)
+            expected.setdefault(key, []).append(key)
+        self.assert_tree(tree, expected, reverse=True)
+
+        for key in rng.sample(range(200), 100):
+            tree.remove_key(key)
+            expected.pop(key, None)
+            self.assertFalse(tree.contains(key))
+        self.assert_tree(tree, expected, reverse=True)
+        for key in expected:
+            self.assertTrue(key in tree)
+            self.assertEqual(tree[key]._key, key)
+
+        # Unsorted pairs, sorted with our comparator and merged in.
+        items = [(key, -key) for key in rng.sample(range(300), 300)]
+        tree.update(items)
+        for key, value in items:
+            expected.setdefault(key, []).append(value)
+        self.assert_tree(tree, expected, reverse=True)
+
+        # Small updates to a bigger tree go one at a time.
+        tree.update([(1000, 1), (-5, 2)])
+        expected[1000] = [1]
+        expected[-5] = [2]
+        self.assert_tree(tree, expected, reverse=True)
+
+    def check_backend(self, backend):
+        """ Runs a tree with the given backend through its paces. """
+
+        tree = RedBlackTree(backend=backend)
+        self.assertIsNotNone(tree._impl)
+
+        tree.add(3, "c")
+        tree.add(1, "a")
+        tree.add(1, "b")
+        tree.update([(2, "x"), (5, "y")])
+        self.assertTrue(1 in tree)
+        self.assertFalse(4 in tree)
+        self.assertEqual(
+            tree.in_order(tree._root),
+            [
+                (1, ["a", "b"], None, None), (2, ["x"], None, None),
+                (3, ["c"], None, None), (5, ["y"], None, None)
+            ]
+        )
+
+        # Values go one at a time, the key once it has none.
+        tree.remove_value(1, "a")
+        self.assertTrue(1 in tree)
+        tree.remove_value(1, "b")
+        self.assertFalse(1 in tree)
+        tree.remove_key(3)
+        tree.remove_key(4)
+        self.assertEqual(
+            [key for key, _, _, _ in tree.in_order(tree._root)], [2, 5]
+        )
+
+        # No nodes to hand out.
+        with self.assertRaises(Exception):
+            tree.find_node(2)
+        with self.assertRaises(Exception):
+            tree[2]
+
+    def test_intdict_backend(self):
+        self.check_backend("intdict")
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("sortedcontainers"),
+        "sortedcontainers isn't installed"
+    )
+    def test_sortedcontainers_backend(self):
+        self.check_backend("sortedcontainers")
+
+    def test_backend_choices(self):
+
+        # A custom comparator keeps to nodes.
+        tree = RedBlackTree(
+            key_comparator_function=lambda one, two: one < two,
+            backend="intdict"
+        )
+        self.assertIsNone(tree._impl)
+        tree.add(1, "a")
+        self.assertEqual(tree[1]._values, ["a"])
+
+        # Unknown names are refused either way.
+        with self.assertRaises(Exception):
+            RedBlackTree(backend="bogus")
+        with self.assertRaises(Exception):
+            RedBlackTree(
+                key_comparator_function=lambda one, two: one < two,
+                backend="bogus"
+            )
+
+        # Everything we export is there.
+        for name in src.redblacktree.__all__:
+            self.assertTrue(hasattr(src.redblacktree, name), name)
+
+    def test_multi_value(self):
+        for multi_value, functions in RedBlackTree.MULTI_VALUES.items():
+            values_type = functions[0]
+            with self.subTest(multi_value=multi_value):
+                tree = RedBlackTree(multi_value=multi_value)
+                keeps_duplicates = values_type is list
+
+                # Duplicates only stay in a list.
+                tree.add(1, "a")
+                tree.add(1, "a")
+                tree.add(1, "b")
+                self.assertIsInstance(tree[1]._values, values_type)
+                self.assertEqual(
+                    sorted(tree[1]._values),
+                    ["a", "a", "b"] if keeps_duplicates else ["a", "b"]
+                )
+
+                # A merging update adds to our container, not a new one.
+                values = tree[1]._values
+                tree.update([(1, "c"), (1, "a"), (2, "d"), (0, "e")])
+                self.assertIs(tree[1]._values, values)
+                self.assertEqual(
+                    sorted(values),
+                    ["a", "a", "a", "b", "c"] if keeps_duplicates
+                    else ["a", "b", "c"]
+                )
+                self.assertEqual(list(tree[2]._values), ["d"])
+                self.assertTrue(tree.is_set_correctly(tree._root)[0])
+
+                # The key goes once its last value does.
+                tree.remove_value(2, "d")
+                self.assertFalse(2 in tree)
+                for value in sorted(values):
+                    tree.remove_value(1, value)
+                self.assertFalse(1 in tree)
+                self.assertEqual(
+                    [key for key, _, _, _ in tree.in_order(tree._root)], [0]
+                )
+
+        with self.assertRaises(Exception):
+            RedBlackTree(multi_value="tuple")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,18 +23,23 @@
 """
 
 # Sys Imperttss!
-from enum import Enum
+from enum import IntEnum
+import functools
 import operator
 
 
 # __all__ is a global list of classes
-__all__ = ["RBColorEnum", "RBDirectionEnum", "RBNode", "RedblackTree"]
+__all__ = [
+    "RBColorEnum", "RBDirectionEnum", "RBNode", "RedBlackTree",
+    "IntDictBackend", "SortedDictBackend"
+]
 
 
-class RBColorEnum(Enum):
+class RBColorEnum(IntEnum):
     """
     RBColorEnum, used by our RedblackTree
     Defines Colors for nodes.
+    Nodes store the plain int, which still compares equal to these members.
     """
 
     black = 0
@@ -42,25 +47,45 @@ class RBColorEnum(Enum):
     RED = 2
 
 
-class RBDirectionEnum(Enum):
+# Colors as plain ints, used internally.
+# Comparing small ints avoids Enum.__eq__ on every color check.
+BLACK = RBColorEnum.black.value
+NIL = RBColorEnum.NIL.value
+RED = RBColorEnum.RED.value
+
+
+class RBDirectionEnum(IntEnum):
     """
     RBDirectionEnum for RedblackEnum
     Defines directions for RedblackTree
+    Members are ints, so they compare equal to the plain directions below.
     """
 
     LEFT = 0
     RIGHT = 1
 
 
+# Directions as plain ints, used internally.
+# They index a node's _child list, so LEFT/RIGHT arms can share code.
+LEFT = RBDirectionEnum.LEFT.value
+RIGHT = RBDirectionEnum.RIGHT.value
+
+
 class RBNode:
     """
     Red-black Node in a Binary Tree
+    Nodes compare (and hash) by identity.
     """
 
     # Slots are useful to define what class variables this class will have
     # This reduces RAM consumption since Python naturally hands all classes
     # a dictionary's worth of variable storage.
-    __slots__ = ["_key", "_values", "_color", "_parent", "_left", "_right"]
+    # Children live in _left/_right, for lookups, and again in _child,
+    # indexed by LEFT/RIGHT, for code that works either way.  Write them
+    # with set_child (or both at once) so the two never disagree.
+    __slots__ = [
+        "_key", "_values", "_color", "_parent", "_left", "_right", "_child"
+    ]
 
     def __init__(self, key, value, color, parent=None, left=None, right=None):
         """ Constructor! """
@@ -72,43 +97,7 @@ class RBNode:
         self._parent = parent
         self._left = left
         self._right = right
-
-    def __eq__(self, other):
-        """
-        Equals
-        If this node is set to = or != something else,
-        this handles it.
-        """
-
-        # Other is a RBNode?
-        if isinstance(other, RBNode):
-
-            # Neither node set up?
-            if self._color == RBColorEnum.NIL and self._color == other._color:
-                return True
-
-            # Comparison if our Parents are the same.
-            if self._parent is None or other._parent is None:
-                parents_are_same = (
-                    self._parent is None and
-                    other._parent is None
-                )
-            else:
-                parents_are_same = (
-                    self._parent._key == other._parent._key and
-                    self._parent._color == other._parent._color
-                )
-
-            # Everything matches!?
-            return (
-                self._key == other._key and
-                self._color == other._color and
-                parents_are_same
-            )
-
-        # Let the other object handle it!
-        else:
-            return other.__eq__(self)
+        self._child = [left, right]
 
     def __iter__(self):
         """
@@ -117,20 +106,23 @@ class RBNode:
         It waits for something to request the inner result.
         """
 
-        if self._left._color != RBColorEnum.NIL:
-            yield from self._left.__iter__()
+        left, right = self._child
+
+        if left is not NIL_NODE:
+            yield from left.__iter__()
 
         yield self.__repr__()
 
-        if self._right._color != RBColorEnum.NIL:
-            yield from self._right.__iter__()
+        if right is not NIL_NODE:
+            yield from right.__iter__()
 
     def __repr__(self):
         """
         Formal String
         """
 
-        return f"{self._color} {self._key} {self._values} RBNode"
+        color = RBColorEnum(self._color).name
+        return f"{color} {self._key} {self._values} RBNode"
 
     def has_children(self) -> bool:
         """
@@ -144,34 +136,172 @@ class RBNode:
         Returns the number of NOT NIL children the node has
         """
 
-        if self._color == RBColorEnum.NIL:
+        if self is NIL_NODE:
             return 0
 
         return sum(
             [
-                int(self._left._color != RBColorEnum.NIL),
-                int(self._right._color != RBColorEnum.NIL)
+                int(self._left is not NIL_NODE),
+                int(self._right is not NIL_NODE)
             ]
         )
 
+    def set_child(self, direction, node):
+        """
+        Sets our child on the given side, keeping _left/_right and _child
+        the same.
+        """
+
+        self._child[direction] = node
+        if direction == LEFT:
+            self._left = node
+        else:
+            self._right = node
+
+
+# Every node has null nodes as children initially,
+# create one such object for easy management.
+# Module level, so methods load it as a global rather than through self.
+# It's black, like any leaf, and links back to itself, so color checks
+# and child/parent loads on it never need a None check.
+NIL_NODE = RBNode(key=None, value=None, color=BLACK)
+NIL_NODE._parent = NIL_NODE
+NIL_NODE.set_child(LEFT, NIL_NODE)
+NIL_NODE.set_child(RIGHT, NIL_NODE)
+
+
+class IntDictBackend:
+    """
+    Alternative storage for RedBlackTree, a plain dict of key to values.
+    add/contains/remove are O(1), keys are sorted when walked in order.
+    """
+
+    __slots__ = ["_data"]
+
+    def __init__(self):
+        """ Constructor! """
+
+        self._data = {}
+
+    def add(self, key, value):
+        """
+        Adds the given Key/Value
+        """
+
+        values = self._data.get(key)
+        if values is None:
+            self._data[key] = [value]
+        else:
+            values.append(value)
+
+    def contains(self, key):
+        """
+        Is the key here?
+        """
+
+        return key in self._data
+
+    def items(self):
+        """
+        Returns (key, values) pairs, in key order.
+        """
+
+        return sorted(self._data.items())
+
+    def remove_key(self, key):
+        """
+        Removes a key and all of its values, if present.
+        """
+
+        self._data.pop(key, None)
+
+    def remove_value(self, key, value):
+        """
+        Removes a single value, and the key once it has none left.
+        """
+
+        values = self._data.get(key)
+        if values is None:
+            return
+
+        if value in values:
+            values.remove(value)
+
+        if not values:
+            del self._data[key]
+
+
+class SortedDictBackend(IntDictBackend):
+    """
+    Alternative storage for RedBlackTree, backed by sortedcontainers'
+    SortedDict.  Keys are kept ordered, so no sorting when walked.
+    """
+
+    __slots__ = []
+
+    def __init__(self):
+        """ Constructor! """
+
+        # Optional dependency, only needed if this backend is asked for.
+        from sortedcontainers import SortedDict
+
+        self._data = SortedDict()
+
+    def items(self):
+        """
+        Returns (key, values) pairs, in key order.
+        """
+
+        return list(self._data.items())
+
 
 class RedBlackTree:
     """
     Red/Black Tree
     """
 
-    # Every node has null nodes as children initially,
-    # create one such object for easy management
-    NIL_NODE = RBNode(key=None, value=None, color=RBColorEnum.NIL, parent=None)
+    # Named alternatives to our red-black nodes, picked with backend=.
+    BACKENDS = {
+        "intdict": IntDictBackend,
+        "sortedcontainers": SortedDictBackend
+    }
+
+    # What a node's values can be kept in, picked with multi_value=.
+    # Each is the container type, how to add to it and how to remove.
+    # list keeps duplicates, set/dict drop them but remove in O(1),
+    # and dict keeps the order values were added in.
+    MULTI_VALUES = {
+        "list": (list, list.append, list.remove),
+        "set": (set, set.add, set.remove),
+        "dict": (dict, dict.setdefault, dict.pop)
+    }
+
+    # Every tree's attributes, no per-instance dict needed.
+    __slots__ = [
+        "_key_comparator_function", "_key_equals_function",
+        "_key_validator_function", "_default_cmp", "_root", "_impl",
+        "_values_type", "_values_add", "_values_remove"
+    ]
+
+    # Kept here too for anyone reaching for it through the tree.
+    NIL_NODE = NIL_NODE
 
     def __init__(
         self,
         key_comparator_function=None,
         key_equals_function=None,
-        key_validator_function=None
+        key_validator_function=None,
+        backend=None,
+        multi_value="list"
        ):
         """
         Constructor?
+        backend can name one of BACKENDS to store keys there instead of
+        in red-black nodes.  The node methods (find_node, get_*, rotate...)
+        only apply to the red-black storage.  A custom comparator or equals
+        function always uses the red-black storage.
+        multi_value names one of MULTI_VALUES for each node's values,
+        the backends always use a list.
         """
 
         # Key Comparator handles greater and less than
@@ -186,6 +316,13 @@ class RedBlackTree:
         else:
             self._key_equals_function = key_equals_function
 
+        # With neither given, find_node can compare keys inline instead of
+        # calling through our simple functions.
+        self._default_cmp = (
+            key_comparator_function is None and
+            key_equals_function is None
+        )
+
         # Key Validator is used for Add/Remove, ensuring the key entered
         # is a valid entry
         # ... this probably isn't needed?
@@ -194,9 +331,25 @@ class RedBlackTree:
         else:
             self._key_validator_function = key_validator_function
 
+        # What our nodes keep their values in.
+        if multi_value not in self.MULTI_VALUES:
+            raise Exception(f"Unknown multi_value: {multi_value}!")
+        (
+            self._values_type,
+            self._values_add,
+            self._values_remove
+        ) = self.MULTI_VALUES[multi_value]
+
         # Root!
         self._root = None
 
+        # Alternative storage, if asked for and our comparisons allow it.
+        if backend is not None and backend not in self.BACKENDS:
+            raise Exception(f"Unknown backend: {backend}!")
+        self._impl = None
+        if backend is not None and self._default_cmp:
+            self._impl = self.BACKENDS[backend]()
+
     def __contains__(self, key):
         """
         Contains?
@@ -215,15 +368,27 @@ class RedBlackTree:
     def __getitem__(self, key):
         """
         Get an item?
+        Raises a KeyError if the key isn't in our tree.
+        Returns the node, so this isn't there with backend storage.
         """
 
-        return self.find_node(key)[0]
+        node, _ = self.find_node(key)
+        if node is None:
+            raise KeyError(key)
+
+        return node
 
     def __iter__(self):
         """
         Iteratoor!
         """
 
+        # Other storage?
+        if self._impl is not None:
+            for key, values in self._impl.items():
+                yield f"{key} {values}"
+            return
+
         # No data?
         if not self._root:
             return []
@@ -252,15 +417,15 @@ class RedBlackTree:
         if not self.validate_key(key):
             return
 
+        # Other storage?
+        if self._impl is not None:
+            self._impl.add(key, value)
+            return
+
         #  Need a root?  YOU GOT IT.
         if not self._root:
-            self._root = RBNode(
-                key=key,
-                value=value,
-                color=RBColorEnum.black,
-                parent=None,
-                left=self.NIL_NODE,
-                right=self.NIL_NODE
+            self._root = self.__new_node(
+                key, self.__new_values(value), BLACK, None
             )
             return
 
@@ -273,22 +438,14 @@ class RedBlackTree:
 
         # Parent but no Direction?  ADD!
         elif node_dir is None:
-            parent._values.append(value)
+            self._values_add(parent._values, value)
             return
 
         # Create a new node and either add it to our left or right, as needed.
-        new_node = RBNode(
-            key=key,
-            value=value,
-            color=RBColorEnum.RED,
-            parent=parent,
-            left=self.NIL_NODE,
-            right=self.NIL_NODE
+        new_node = self.__new_node(
+            key, self.__new_values(value), RED, parent
         )
-        if node_dir == RBDirectionEnum.LEFT:
-            parent._left = new_node
-        else:
-            parent._right = new_node
+        parent.set_child(node_dir, new_node)
 
         # Try to balance us!
         self.try_rebalance(new_node)
@@ -299,60 +456,135 @@ class RedBlackTree:
         the given value is present in the tree
         """
 
-        return bool(self.find_node(key)[0])
+        # Other storage?
+        if self._impl is not None:
+            return self._impl.contains(key)
+
+        # Custom comparisons?  find_node knows how.
+        if not self._default_cmp:
+            return self.find_node(key)[0] is not None
+
+        # Otherwise just walk down, no tuple to build.
+        node = self._root
+        if node is None:
+            return False
+
+        while node is not NIL_NODE:
+            node_key = node._key
+            if key == node_key:
+                return True
+            elif key < node_key:
+                node = node._left
+            else:
+                node = node._right
+
+        return False
 
     def find_node(self, key, to_nil=False):
         """
         Given a key, attempts to find it in our Tree.
         If we have to_nil as True, we are looking for a Nil node to
         put its data in.
+        Always returns (node, direction), (None, None) when there's nothing.
+        Other storage has no nodes, so asking it for one raises.
         """
 
-        def inner_find(node):
-            """
-            Recursion function to find a node!
-            """
+        # Other storage?  No nodes to give.
+        if self._impl is not None:
+            raise Exception("There are no nodes with backend storage!")
+
+        # Nothing to look through?
+        if not self._root:
+            return None, None
+
+        # Walk down from the root, no recursion needed.
+        nil_node = NIL_NODE
+        node = self._root
+
+        # Default comparisons?  Do them inline, no function calls.
+        if self._default_cmp:
+            while node is not nil_node:
+                node_key = node._key
+
+                # Key presented same as one we want?
+                if key == node_key:
+                    return node, None
+
+                # Less Than!
+                elif key < node_key:
+                    child_node = node._left
+
+                    # We going to_nil and it a match?
+                    if to_nil and child_node is nil_node:
+                        return node, LEFT
+
+                # Greater Than!
+                else:
+                    child_node = node._right
+
+                    # We going to_nil and it a match?
+                    if to_nil and child_node is nil_node:
+                        return node, RIGHT
+
+                # Go on.
+                node = child_node
 
             # Nope!
-            if not node or node == self.NIL_NODE:
-                return None, None
+            return None, None
+
+        # Our functions as locals, saves looking them up every level.
+        key_equals = self._key_equals_function
+        key_comparator = self._key_comparator_function
+
+        while node is not nil_node:
 
             # Key presented same as one we want?
-            elif self._key_equals_function(key, node._key):
+            if key_equals(key, node._key):
                 return node, None
 
             # Greater Than!
-            elif not self._key_comparator_function(key, node._key):
+            elif not key_comparator(key, node._key):
+                child_node = node._right
 
                 # We going to_nil and it a match?
-                if to_nil and node._right == self.NIL_NODE:
-                    return node, RBDirectionEnum.RIGHT
-
-                # Go on.
-                return inner_find(node._right)
+                if to_nil and child_node is nil_node:
+                    return node, RIGHT
 
             # Less Than!
-            elif self._key_comparator_function(key, node._key):
+            else:
+                child_node = node._left
 
                 # We going to_nil and it a match?
-                if to_nil and node._left == self.NIL_NODE:
-                    return node, RBDirectionEnum.LEFT
+                if to_nil and child_node is nil_node:
+                    return node, LEFT
 
-                # Go on.
-                return inner_find(node._left)
+            # Go on.
+            node = child_node
 
-        # Return!
-        if self._root:
-            return inner_find(self._root)
-        else:
-            return self.NIL_NODE
+        # Nope!
+        return None, None
+
+    @classmethod
+    def from_sorted(cls, items, *args, **kwargs):
+        """
+        Builds a new tree from (key, value) pairs already in key order.
+        Nodes are placed balanced and colored straight away, so there are
+        no rotations or recolors, O(n) instead of n adds.
+        Any other arguments go to the constructor.
+        """
+
+        tree = cls(*args, **kwargs)
+        tree.update(items, is_sorted=True)
+
+        return tree
 
     def get_child_node(self, node):
         """
         Gets our Child, left first.
         """
 
-        return node._left if node._left != self.NIL_NODE else node._right
+        left, right = node._child
+        return left if left is not NIL_NODE else right
 
     def get_grandparent_node(self, node):
         """
@@ -368,10 +600,10 @@ class RedBlackTree:
         """
 
         # To the right, to the right!
-        if node._right != self.NIL_NODE:
-            return self.get_maximum_node(node._right)
-        else:
-            return node
+        while node._right is not NIL_NODE:
+            node = node._right
+
+        return node
 
     def get_minimum_node(self, node):
         """
@@ -380,10 +612,10 @@ class RedBlackTree:
         """
 
         # Must... go... DEEPER!
-        if node._left != self.NIL_NODE:
-            return self.get_minimum_node(node._left)
-        else:
-            return node
+        while node._left is not NIL_NODE:
+            node = node._left
+
+        return node
 
     def get_node_color(self, node):
         """
@@ -394,7 +626,7 @@ class RedBlackTree:
 
         if node:
             return node._color
-        return RBColorEnum.NIL
+        return NIL
 
     def get_parent_node(self, node):
         """
@@ -415,20 +647,20 @@ class RedBlackTree:
             20 (A)
            /     \
         15(B)    25(C)
-        __get_sibling(25(C)) => 15(B), RBDirectionEnum.RIGHT
+        __get_sibling(25(C)) => 15(B), LEFT
         """
 
-        # Our Parent
-        parent_node = self.get_parent_node(node)
+        # Our Parent, read straight off the node.
+        parent_node = node._parent if node else None
 
         # Find the sibling!  If we have a Parent
         if parent_node:
 
             # We left or right?
-            if parent_node._left == node:
-                return parent_node._right, RBDirectionEnum.RIGHT
+            if parent_node._left is node:
+                return parent_node._right, RIGHT
             else:
-                return parent_node._left, RBDirectionEnum.LEFT
+                return parent_node._left, LEFT
 
         # No parent, return none!
         else:
@@ -453,18 +685,35 @@ class RedBlackTree:
     def in_order(self, node):
         """
         Returns a list of our Nodes from left to ride, in order.
+        Each is a (key, values, parent, color) tuple.
+        Other storage has no parents/colors, so those are None.
         """
 
-        # Gotta have one!
-        if node:
-            return (
-                self.in_order(node._left) +
-                [[node._key, node._values, node._parent, node._color]] +
-                self.in_order(node._right)
-            )
+        # Other storage?
+        if self._impl is not None:
+            return [
+                (key, values, None, None)
+                for key, values in self._impl.items()
+            ]
 
-        # Return Empty
-        return []
+        # Our rows, and the nodes we still need to come back to.
+        rows = []
+        stack = []
+
+        # Go all the way left, then take the node and go right.
+        nil_node = NIL_NODE
+        while stack or (node is not None and node is not nil_node):
+            if node is not None and node is not nil_node:
+                stack.append(node)
+                node = node._left
+            else:
+                node = stack.pop()
+                rows.append(
+                    (node._key, node._values, node._parent, node._color)
+                )
+                node = node._right
+
+        return rows
 
     def is_node_color(self, color, op, *nodes):
         """
@@ -480,21 +729,21 @@ class RedBlackTree:
         Are the given node(s), black?
         """
 
-        return self.is_node_color(RBColorEnum.black, operator.eq, *nodes)
+        return all(node._color == BLACK for node in nodes)
 
     def is_node_red(self, *nodes):
         """
         Are the given node(s) RED?
         """
 
-        return self.is_node_color(RBColorEnum.RED, operator.eq, *nodes)
+        return all(node._color == RED for node in nodes)
 
     def is_node_not_red(self, *nodes):
         """
         Are the givne node(s), not RED?
         """
 
-        return self.is_node_color(RBColorEnum.RED, operator.ne, *nodes)
+        return all(node._color != RED for node in nodes)
 
     def is_set_correctly(self, node):
         """
@@ -503,37 +752,51 @@ class RedBlackTree:
         """
 
         # If node is a leaf, check Property 2
-        if not node:
+        if node is None or node is NIL_NODE:
             return True, 1
 
         # If node is the root, check Property 0
-        if not self.get_parent_node(node) and self.is_node_red(node):
+        if node._parent is None and node._color == RED:
             return False, 0
 
-        # If node is red, check Property 3
-        if self.is_node_red(node):
-
-            # Count of Green
-            green_count = 0
-
-            # Check our left/right children and see if they are YELLOW
-            if (
-                (node._left and self.is_node_red(node._left)) or
-                (node._right and self.is_node_red(node._right))
-            ):
+        # Children before parents, with an explicit stack rather than
+        # recursion.  Green counts (black heights) of finished nodes wait
+        # in green_counts until their parent picks them up.
+        root_node = node
+        green_counts = {}
+        stack = [(node, False)]
+        while stack:
+            node, children_done = stack.pop()
+            left, right = node._child
+
+            # Children not checked yet?  Check Property 3, then queue them.
+            if not children_done:
+                if node._color == RED and (
+                    left._color == RED or right._color == RED
+                ):
+                    return False, -1
+
+                stack.append((node, True))
+                for child_node in (right, left):
+                    if child_node is not NIL_NODE:
+                        stack.append((child_node, False))
+                continue
+
+            # Check the subtrees for Property 4
+            green_count_left = (
+                1 if left is NIL_NODE else green_counts.pop(left)
+            )
+            green_count_right = (
+                1 if right is NIL_NODE else green_counts.pop(right)
+            )
+            if green_count_left != green_count_right:
                 return False, -1
 
-        # The number of GREEN nodes to the leaves includes the same node
-        else:
-            green_count = 1
-
-        # Check the subtrees for Property 4
-        right, green_count_right = self.is_set_correctly(node._right)
-        left, green_count_left = self.is_set_correctly(node._left)
+            # The number of GREEN nodes to the leaves includes the same node
+            green_counts[node] = green_count_right + (node._color != RED)
 
-        # We all True?
-        return all([right, left, green_count_right == green_count_left]),
-        green_count_right + green_count
+        # We all True!
+        return True, green_counts[root_node]
 
     def node_comparator(self, node_one, node_two):
         """
@@ -549,6 +812,11 @@ class RedBlackTree:
         its successor.
         """
 
+        # Other storage?
+        if self._impl is not None:
+            self._impl.remove_key(key)
+            return
+
         #  Grab our Node to Remove
         node_to_remove, _ = self.find_node(key)
 
@@ -569,7 +837,9 @@ class RedBlackTree:
         if node.get_children_count() == 2:
             successor = self.get_minimum_node(node._right)
             node._key = successor._key
-            node._values = successor._values
+
+            # Swap lists, ours leaves the tree with the successor's node.
+            node._values, successor._values = successor._values, node._values
             node = successor
 
         # Has 0 or 1 children!
@@ -581,12 +851,21 @@ class RedBlackTree:
         If it is the lone Value of a node, removes the node as well.
         """
 
+        # Other storage?
+        if self._impl is not None:
+            self._impl.remove_value(key, value)
+            return
+
         # Get our node.
         node, _ = self.find_node(key)
 
+        # Not in our tree?
+        if node is None:
+            return
+
         # Our value here?
         if value in node._values:
-            node._values.remove(value)
+            self._values_remove(node._values, value)
 
         # Any values left?
         if len(node._values) == 0:
@@ -601,7 +880,7 @@ class RedBlackTree:
         """
 
         # Get our Great Grand Parent
-        great_grandparent_node = self.get_parent_node(grandparent_node)
+        great_grandparent_node = grandparent_node._parent
 
         # Update the parent.
         self.__update_parent(
@@ -609,130 +888,121 @@ class RedBlackTree:
             great_grandparent_node
         )
 
-        # Stored Node
-        stored_node = None
-
-        if direction == RBDirectionEnum.LEFT:
-
-            # Store and change.
-            stored_node = parent_node._left
-            parent_node._left = grandparent_node
-
-            # Save the old left values
-            grandparent_node._right = stored_node
-
-        else:
-
-            # Store and change.
-            stored_node = parent_node._right
-            parent_node._right = grandparent_node
+        # Store and change, the stored node goes on the opposite side
+        # of the grandparent.
+        stored_node = parent_node._child[direction]
+        parent_node.set_child(direction, grandparent_node)
+        grandparent_node.set_child(1 - direction, stored_node)
 
-            # Save the old right values
-            grandparent_node._left = stored_node
-
-        # Update Parents
+        # Update Parents, NIL_NODE keeps pointing at itself.
         grandparent_node._parent = parent_node
-        stored_node._parent = grandparent_node
+        if stored_node is not NIL_NODE:
+            stored_node._parent = grandparent_node
 
         # Need to recolor?
         if to_recolor:
-            parent_node._color = RBColorEnum.black
-            node._color = RBColorEnum.RED
-            grandparent_node._color = RBColorEnum.RED
+            parent_node._color = BLACK
+            node._color = RED
+            grandparent_node._color = RED
 
     def try_rebalance(self, node):
         """
         Given a red child node, determine if there is a need to
         rebalance (if the parent is red)
         If there is, rebalance it
+        A RED uncle pushes black down from the grandparent, and then the
+        grandparent is checked the same way, so we loop upwards.
         """
 
-        # Store our Parent and Grandparent
-        parent_node = self.get_parent_node(node)
-        grandparent_node = self.get_parent_node(parent_node)
+        while True:
 
-        # Need to rebalance!
-        if (
-            parent_node is None or
-            grandparent_node is None or
-            (
-                self.is_node_not_red(node) or
-                self.is_node_not_red(parent_node)
+            # Store our Parent and Grandparent
+            parent_node = node._parent
+            grandparent_node = (
+                parent_node._parent if parent_node is not None else None
             )
-        ):
-            return
 
-        # What direction is our node from the parent?
-        node_dir = (
-            RBDirectionEnum.LEFT
-            if self.node_comparator(node, parent_node)
-            else RBDirectionEnum.RIGHT
-        )
-        parent_node_dir = (
-            RBDirectionEnum.LEFT
-            if self.node_comparator(parent_node, grandparent_node)
-            else RBDirectionEnum.RIGHT
-        )
-        uncle_node = self.get_uncle_node(node)
-        # grandparent_node._right if parent_node_dir == RBDirectionEnum.LEFT
-        # else grandparent_node._left
+            # Need to rebalance!
+            if (
+                parent_node is None or
+                grandparent_node is None or
+                node._color != RED or
+                parent_node._color != RED
+            ):
+                return
 
-        # General Direction we are going.
-        general_direction = (node_dir, parent_node_dir)
+            # What direction is our node from the parent, and the parent
+            # from the grandparent?
+            node_dir = LEFT if parent_node._left is node else RIGHT
+            parent_node_dir = (
+                LEFT if grandparent_node._left is parent_node else RIGHT
+            )
+            uncle_node = grandparent_node._child[1 - parent_node_dir]
 
-        # Not a RED Uncle?
-        if self.is_node_not_red(uncle_node):
+            # Not a RED Uncle?
+            if uncle_node._color != RED:
 
-            # Rotate
-            if (general_direction == (
-                    RBDirectionEnum.LEFT,
-                    RBDirectionEnum.LEFT
-            )):
-                self.rotate(
-                    RBDirectionEnum.RIGHT, node,
-                    parent_node, grandparent_node, True)
+                # Zig-zag?  Rotate our node up over the parent first.
+                if node_dir != parent_node_dir:
+                    self.rotate(1 - node_dir, None, node, parent_node)
+
+                    # Due to the prev rotation, our node is now the parent
+                    node, parent_node = parent_node, node
 
-            elif (general_direction == (
-                    RBDirectionEnum.RIGHT,
-                    RBDirectionEnum.RIGHT
-            )):
+                # Rotate the parent up over the grandparent.
                 self.rotate(
-                    RBDirectionEnum.LEFT, node,
+                    1 - parent_node_dir, node,
                     parent_node, grandparent_node, True)
 
-            elif (general_direction == (
-                    RBDirectionEnum.LEFT,
-                    RBDirectionEnum.RIGHT
-            )):
-                self.rotate(
-                    RBDirectionEnum.RIGHT, None,
-                    node, parent_node)
-                # Due to the prev rotation, our node is now the parent
-                self.rotate(
-                    RBDirectionEnum.LEFT, parent_node,
-                    node, grandparent_node, True)
+                # Rotations finish us off.
+                return
 
-            elif (general_direction == (
-                    RBDirectionEnum.RIGHT,
-                    RBDirectionEnum.LEFT
-            )):
-                self.rotate(
-                    RBDirectionEnum.LEFT, None,
-                    node, parent_node)
-                # Due to the prev rotation, our node is now the parent
-                self.rotate(
-                    RBDirectionEnum.RIGHT, parent_node,
-                    node, grandparent_node, True)
+            # Uncle is RED, push black down from the grandparent.
+            # Never onto NIL_NODE though, every tree shares it.
+            for child_node in grandparent_node._child:
+                if child_node is not NIL_NODE:
+                    child_node._color = BLACK
 
-            else:
-                raise Exception(
-                                f"{general_direction}"
-                                f" is not a valid direction!"
-                )
+            # Root is always black!
+            if grandparent_node is not self._root:
+                grandparent_node._color = RED
+
+            # Now check the grandparent.
+            node = grandparent_node
+
+    def update(self, items, is_sorted=False):
+        """
+        Adds many (key, value) pairs.
+        The tree is built in one go (see from_sorted), sorting the pairs
+        first unless is_sorted says they already are.
+        A built tree with no more nodes than there are new pairs is merged
+        with them and rebuilt, otherwise the pairs are added one by one.
+        A rebuild keeps every node we had for its own key.
+        """
 
-        # Uncle is RED
+        # Other storage?  Add them.
+        if self._impl is not None:
+            for key, value in items:
+                self.add(key, value)
+            return
+
+        # Get us in key order, duplicates keep their order.
+        if self._default_cmp:
+            item_key = operator.itemgetter(0)
         else:
-            self.__recolor(grandparent_node)
+            item_key = functools.cmp_to_key(self.__item_comparator)
+        items = list(items) if is_sorted else sorted(items, key=item_key)
+
+        # Already built?  Too big to be worth a rebuild?  Add them.
+        nodes = None
+        if self._root:
+            nodes = self.__nodes_in_order(len(items))
+            if nodes is None:
+                for key, value in items:
+                    self.add(key, value)
+                return
+
+        self.__build_sorted(items, nodes)
 
     def update_key(self, key, value, new_key):
         """
@@ -755,21 +1025,182 @@ class RedBlackTree:
         else:
             return True
 
-    def __recolor(self, grandparent):
+    def __build_sorted(self, items, nodes=None):
+        """
+        Given key ordered (key, value) pairs, builds our tree.
+        nodes, if given, are all of our current nodes in key order.  They
+        are placed again for their own keys, taking on any new values.
+        Middle keys become parents, so every level but the deepest is full.
+        The deepest level is RED and the rest black, which keeps the
+        black height the same down every path.
+        """
+
+        # Group up the values of equal keys, making sure each key comes
+        # after the one before it.
+        keys = []
+        values = []
+        for key, value in items:
+            self.validate_key(key)
+            if keys and self._key_equals_function(keys[-1], key):
+                self._values_add(values[-1], value)
+            elif keys and self._key_comparator_function(key, keys[-1]):
+                raise Exception(f"Key {key} is out of order!")
+            else:
+                keys.append(key)
+                values.append(self.__new_values(value))
+
+        # Rebuilding?  Work our nodes in, the tree isn't touched until all
+        # of the pairs have checked out above.
+        reused = [None] * len(keys)
+        if nodes:
+            keys, values, reused = self.__merge_nodes(nodes, keys, values)
+
+        # Nothing?  Nothing to do.
+        count = len(keys)
+        if not count:
+            return
+
+        # Depth of our deepest level.
+        deepest = count.bit_length() - 1
+
+        # Ranges of keys still to place, with where they hang from.
+        stack = [(0, count, None, LEFT, 0)]
+        while stack:
+            low, high, parent_node, direction, depth = stack.pop()
+            middle = (low + high) // 2
+
+            # Deepest level is RED, unless that's just the root.
+            # One of our nodes?  Just reset its links.
+            color = RED if depth == deepest and depth else BLACK
+            node = reused[middle]
+            if node is None:
+                node = self.__new_node(
+                    keys[middle], values[middle], color, parent_node
+                )
+            else:
+                node._color = color
+                node._parent = parent_node
+                node._child[LEFT] = node._left = NIL_NODE
+                node._child[RIGHT] = node._right = NIL_NODE
+
+            # Hang us.
+            if parent_node is None:
+                self._root = node
+            else:
+                parent_node.set_child(direction, node)
+
+            # Our left and right ranges, if any.
+            if low < middle:
+                stack.append((low, middle, node, LEFT, depth + 1))
+            if middle + 1 < high:
+                stack.append((middle + 1, high, node, RIGHT, depth + 1))
+
+    def __item_comparator(self, item_one, item_two):
         """
-        Given a grandparent, pushes down black
+        Compares two (key, value) pairs by key, for sorting with
+        custom key functions.
         """
 
-        # Push it!
-        grandparent._right._color = RBColorEnum.black
-        grandparent._left._color = RBColorEnum.black
+        if self._key_equals_function(item_one[0], item_two[0]):
+            return 0
+        elif self._key_comparator_function(item_one[0], item_two[0]):
+            return -1
+        return 1
+
+    def __merge_nodes(self, nodes, keys, values):
+        """
+        Merges our nodes, in key order, with key ordered new keys and
+        their values.  Returns keys, values and nodes lists, the node is
+        None for a new key.  New values for one of our keys go on after
+        the values it already has.
+        """
+
+        merged_keys = []
+        merged_values = []
+        merged_nodes = []
+        index = 0
+        count = len(keys)
+        for node in nodes:
+
+            # New keys that come before this node.
+            while (
+                index < count and
+                self._key_comparator_function(keys[index], node._key)
+            ):
+                merged_keys.append(keys[index])
+                merged_values.append(values[index])
+                merged_nodes.append(None)
+                index += 1
+
+            # Same key?  Its values join ours.
+            if index < count and self._key_equals_function(
+                keys[index], node._key
+            ):
+                for value in values[index]:
+                    self._values_add(node._values, value)
+                index += 1
 
-        # Root is always black!
-        if grandparent != self._root:
-            grandparent._color = RBColorEnum.RED
+            merged_keys.append(node._key)
+            merged_values.append(node._values)
+            merged_nodes.append(node)
+
+        # Whatever is left comes after all of ours.
+        merged_keys.extend(keys[index:])
+        merged_values.extend(values[index:])
+        merged_nodes.extend([None] * (count - index))
+
+        return merged_keys, merged_values, merged_nodes
+
+    def __new_node(self, key, values, color, parent):
+        """
+        Creates a node with NIL children, holding the given _values.
+        __init__ is skipped as it would build a values list we don't want.
+        """
+
+        node = RBNode.__new__(RBNode)
+        node._key = key
+        node._values = values
+        node._color = color
+        node._parent = parent
+        node._left = NIL_NODE
+        node._right = NIL_NODE
+        node._child = [NIL_NODE, NIL_NODE]
+
+        return node
+
+    def __new_values(self, value):
+        """
+        Gets a new _values container holding just value.
+        """
+
+        values = self._values_type()
+        self._values_add(values, value)
+
+        return values
+
+    def __nodes_in_order(self, limit):
+        """
+        Returns our nodes from left to right, or None if there are more
+        than limit of them.
+        """
+
+        # Same walk as in_order, but we stop early.
+        nodes = []
+        stack = []
+        node = self._root
+        nil_node = NIL_NODE
+        while stack or node is not nil_node:
+            if node is not nil_node:
+                stack.append(node)
+                node = node._left
+            else:
+                node = stack.pop()
+                nodes.append(node)
+                if len(nodes) > limit:
+                    return None
+                node = node._right
 
-        # Rebalance!
-        self.try_rebalance(grandparent)
+        return nodes
 
     def __remove(self, node):
         """
@@ -783,22 +1214,22 @@ class RedBlackTree:
         child_node = self.get_child_node(node)
 
         # We root?
-        if node == self._root:
+        if node is self._root:
 
             # Valid child?
-            if child_node != self.NIL_NODE:
+            if child_node is not NIL_NODE:
 
                 # If we're removing the root and it has one valid child,
                 #  simply make that child the root
                 self._root = child_node
                 self._root._parent = None
-                self._root._color = RBColorEnum.black
+                self._root._color = BLACK
 
             else:
                 self._root = None
 
         # We RED?
-        elif self.is_node_red(node):
+        elif node._color == RED:
 
             # If we have children and we are red, just remove us.
             if not node.has_children():
@@ -817,8 +1248,7 @@ class RedBlackTree:
         else:
 
             # Grab our children.
-            left_child_node = node._left
-            right_child_node = node._right
+            left_child_node, right_child_node = node._child
 
             # Sanity Check
             if (
@@ -832,7 +1262,7 @@ class RedBlackTree:
                 )
 
             # Our child RED?
-            elif self.is_node_red(child_node):
+            elif child_node._color == RED:
                 """
                 Swap the values with the red child and remove it
                 (basically un-link it) Since we're a node with one
@@ -841,9 +1271,12 @@ class RedBlackTree:
                 """
 
                 node._key = child_node._key
-                node._values = child_node._values
-                node._left = child_node._left
-                node._right = child_node._right
+                node._values, child_node._values = (
+                    child_node._values,
+                    node._values
+                )
+                node._child[LEFT] = node._left = child_node._left
+                node._child[RIGHT] = node._right = child_node._right
 
             # black child
             else:
@@ -855,25 +1288,23 @@ class RedBlackTree:
         """
 
         # Get our parent
-        parent_node = self.get_parent_node(node)
-
-        # In those weird cases where they're equal due to the successor swap
-        if (
-            not self._key_comparator_function(node._key, parent_node._key) or
-            self._key_equals_function(node._key, parent_node._key)
-        ):
-            parent_node._right = self.NIL_NODE
+        parent_node = node._parent
+
+        # Whichever side we're on, by identity, so keys that are equal
+        # due to the successor swap don't matter.
+        if parent_node._left is node:
+            parent_node._child[LEFT] = parent_node._left = NIL_NODE
         else:
-            parent_node._left = self.NIL_NODE
+            parent_node._child[RIGHT] = parent_node._right = NIL_NODE
 
     def __remove_black_node(self, node):
         """
-        Loop through each case recursively until we reach a terminating case.
+        Loop through each case until we reach a terminating case.
         What we're left with is a leaf node which is ready to be deleted
         without consequences
         """
 
-        self.__case_1(node)
+        self.__case_1_to_3(node)
         self.__remove_leaf(node)
 
     def __simple_key_comparator(self, key_one, key_two):
@@ -905,38 +1336,28 @@ class RedBlackTree:
         # Did we bring along a parent?
         if new_parent_node:
 
-            # Determine the old child's position in order to put node there
-            if self._key_comparator_function(
-                old_child_node._key,
-                new_parent_node._key
-            ):
-                new_parent_node._left = node
+            # Put node wherever the old child was.
+            if new_parent_node._left is old_child_node:
+                new_parent_node._child[LEFT] = new_parent_node._left = node
             else:
-                new_parent_node._right = node
+                new_parent_node._child[RIGHT] = new_parent_node._right = node
 
         # We root!
         else:
             self._root = node
 
-    def __case_1(self, node):
+    def __case_1_to_3(self, node):
         r"""
+        Cases 1, 2 and 3 in one loop, case 3 passes the double black node
+        upwards, so we just go around again for the parent.
+        Case 1:
         Case 1 is when there's a double black node on the root
         Because we're at the root, we can simply remove it
         and reduce the black height of the whole tree.
             __|10B|__                  __10B__
            /         \      ==>       /       \
           9B         20B            9B        20B
-        """
-
-        # We Root?  We black!
-        if self._root == node:
-            node._color = RBColorEnum.black
-            return
-
-        self.__case_2(node)
-
-    def __case_2(self, node):
-        r"""
+        Case 2:
         Case 2 applies when
             the parent is black
             the sibling is RED
@@ -951,38 +1372,7 @@ class RedBlackTree:
             RIGHT ROTATE it)
         Now the original node's parent is RED
         and we can apply case 4 or case 6
-        """
-
-        # Get our parent and sibling
-        parent_node = self.get_parent_node(node)
-        sibling_node, direction = self.get_sibling_node(node)
-
-        # Our sibling RED, our parent is black, and our sibling doesn't have
-        # RED children.
-        if (
-            self.is_node_red(sibling_node) and
-            self.is_node_black(parent_node) and
-            self.is_node_not_red(
-                sibling_node._left,
-                sibling_node._right
-            )
-        ):
-
-            # Rotate us
-            self.rotate(direction, None, sibling_node, parent_node)
-
-            # Changes colors
-            parent_node._color = RBColorEnum.RED
-            sibling_node._color = RBColorEnum.black
-
-            # Check Root
-            return self.__case_1(node)
-
-        # Next!
-        self.__case_3(node)
-
-    def __case_3(self, node):
-        r"""
+        Case 3:
         Case 3 deletion is when:
             the parent is black
             the sibling is black
@@ -1000,29 +1390,61 @@ class RedBlackTree:
          Continue with other cases
         """
 
-        # Get our parent and sibling
-        parent_node = self.get_parent_node(node)
-        sibling_node, _ = self.get_sibling_node(node)
+        while True:
 
-        # Is our parent and sibling black, and neither of the
-        # sibling's children RED?
-        if (
-            self.is_node_black(sibling_node, parent_node) and
-            self.is_node_not_red(
-                sibling_node._left,
-                sibling_node._right
-            )
-        ):
+            # Case 1, we Root?  We black!
+            if self._root is node:
+                node._color = BLACK
+                return
 
-            # Color the sibling red and forward the double black node upwards
-            # (call the cases again for the parent)
-            sibling_node._color = RBColorEnum.RED
-            return self.__case_1(parent_node)
+            # Get our parent and sibling
+            parent_node = node._parent
+            sibling_node, direction = self.get_sibling_node(node)
 
-        self.__case_4(node)
+            # Case 2, our sibling RED, our parent is black, and our sibling
+            # doesn't have RED children.
+            if (
+                sibling_node._color == RED and
+                parent_node._color == BLACK and
+                sibling_node._left._color != RED and
+                sibling_node._right._color != RED
+            ):
 
-    def __case_4(self, node):
+                # Rotate us, the parent goes down on our side.
+                self.rotate(1 - direction, None, sibling_node, parent_node)
+
+                # Changes colors
+                parent_node._color = RED
+                sibling_node._color = BLACK
+
+                # Check again, with our new sibling.
+                continue
+
+            # Case 3, is our parent and sibling black, and neither of the
+            # sibling's children RED?
+            if (
+                sibling_node._color == BLACK and
+                parent_node._color == BLACK and
+                sibling_node._left._color != RED and
+                sibling_node._right._color != RED
+            ):
+
+                # Color the sibling red and forward the double black node
+                # upwards (go around again for the parent)
+                sibling_node._color = RED
+                node = parent_node
+                continue
+
+            # The rest of the cases share what we found.
+            return self.__case_4_to_6(
+                node, parent_node, sibling_node, direction
+            )
+
+    def __case_4_to_6(self, node, parent_node, sibling_node, direction):
         r"""
+        Cases 4, 5 and 6 in one go, they share the parent, sibling and
+        direction we were handed.
+        Case 4:
         If the parent is red and the sibling is black with no red children,
         simply swap their colors
         DB-Double Black
@@ -1034,36 +1456,7 @@ class RedBlackTree:
         The black height ofthe left subtree has been incremented
         And the on ebelow stays the same
         No consequences, we are done!
-        """
-
-        # Get our parent
-        parent_node = self.get_parent_node(node)
-
-        # Is our parent RED?
-        if self.is_node_red(parent_node):
-
-            # Get our sibling
-            sibling_node, _ = self.get_sibling_node(node)
-
-            # Is our sibling black and both of its children not RED?
-            if (
-                self.is_node_black(sibling_node) and
-                self.is_node_not_red(
-                    sibling_node._left,
-                    sibling_node._right
-                )
-            ):
-
-                # Switch Colors
-                parent_node._color, sibling_node._color = sibling_node._color, parent_node._color
-
-                # Terminating
-                return
-
-        self.__case_5(node)
-
-    def __case_5(self, node):
-        r"""
+        Case 5:
         Case 5 is a rotation that changes the circumstances so that we can do
         a case 6
         If the closer node is red and the outer black or NIL, we do a left/right
@@ -1083,39 +1476,7 @@ class RedBlackTree:
              30R    37B  70R           so we redirect the node
             /   \                      to it :)
           20B   34B
-        """
-
-        # Get our sibling and direction.
-        sibling_node, direction = self.get_sibling_node(node)
-
-        # Get our children.
-        closer_node = (
-            sibling_node._right
-            if direction == RBDirectionEnum.LEFT
-            else sibling_node._left
-        )
-        outer_node = (
-            sibling_node._left
-            if direction == RBDirectionEnum.LEFT
-            else sibling_node._right
-        )
-
-        # Is our sibling black, the closer RED, and our outer not RED?
-        if (
-            self.is_node_red(closer_node) and
-            self.is_node_not_red(outer_node) and
-            self.is_node_black(sibling_node)
-        ):
-
-            # Rotate and set closer to black, setting sibling to RED
-            self.rotate(direction, None, closer_node, sibling_node)
-            closer_node._color = RBColorEnum.black
-            sibling_node._color = RBColorEnum.RED
-
-        self.__case_6(node)
-
-    def __case_6(self, node):
-        r"""
+        Case 6:
         Case 6 requires
             SIBLING to be black
             OUTER NODE to be RED
@@ -1134,36 +1495,56 @@ class RedBlackTree:
                                So we do a right rotation on 35B!
         """
 
-        # Get our sibling and direction
-        sibling_node, direction = self.get_sibling_node(node)
-        outer_node = (
-            sibling_node._left
-            if direction == RBDirectionEnum.LEFT
-            else sibling_node._right
-        )
+        # Case 2 already turned a RED sibling black, so we know our
+        # sibling is black from here on.
 
-        # Internal rotation, given a direction.
-        def __case_6_rotation(direction):
+        # Case 4, is our parent RED?
+        if parent_node._color == RED:
 
-            # Get parent's color
-            parent_node = self.get_parent_node(sibling_node)._color
-            parent_node_color = parent_node._color
-
-            # Rotate our sibling and parent.
-            self.rotate(direction, None, sibling_node, parent_node)
+            # Are both of our sibling's children not RED?
+            if (
+                sibling_node._left._color != RED and
+                sibling_node._right._color != RED
+            ):
 
-            # New parent is sibling
-            sibling_node._color = parent_node_color
-            sibling_node._right._color = RBColorEnum.black
-            sibling_node._left._color = RBColorEnum.black
+                # Switch Colors
+                parent_node._color = BLACK
+                sibling_node._color = RED
 
-        # Is our sibling black and our outer RED?
-        if self.is_node_black(sibling_node) and self.is_node_red(outer_node):
-            return __case_6_rotation(direction)
+                # Terminating
+                return
 
-        raise Exception('We should have ended here, something is wrong')
+        # Case 5, get our children, the outer one is on the sibling's own
+        # side.
+        closer_node = sibling_node._child[1 - direction]
+        outer_node = sibling_node._child[direction]
 
+        # Is the closer RED, and our outer not RED?
+        if closer_node._color == RED and outer_node._color != RED:
 
-# I think this makes sure we are not used as a main file.
-if __name__ == '__main__':
-    pass
\ No newline at end of file
+            # Rotate and set closer to black, setting sibling to RED
+            self.rotate(direction, None, closer_node, sibling_node)
+            closer_node._color = BLACK
+            sibling_node._color = RED
+
+            # The closer node took our sibling's place, and the old
+            # sibling is now its outer node.
+            sibling_node, outer_node = closer_node, sibling_node
+
+        # Case 6, by now our outer is RED.
+        assert (
+            outer_node._color == RED
+        ), 'We should have ended here, something is wrong'
+
+        # Get parent's color
+        parent_node_color = parent_node._color
+
+        # Rotate our sibling and parent, the parent goes down on the
+        # side away from our sibling.
+        self.rotate(1 - direction, None, sibling_node, parent_node)
+
+        # New parent is sibling, its children are our old parent and the
+        # outer node.
+        sibling_node._color = parent_node_color
+        parent_node._color = BLACK
+        outer_node._color = BLACK